@@ -3,16 +3,30 @@ mod har;
 use har::{HarFile, HarRequest, AlignedPair, ComparisonResult, DetailedComparison, WhitelistConfig, parse_har_file, compare_requests, compare_requests_with_whitelist, align_requests_with_whitelist, align_requests_like_vscode_with_whitelist, create_detailed_comparison_with_whitelist, parse_whitelist_config};
 use std::fs;
 use std::collections::HashMap;
+use std::sync::atomic::{AtomicU64, Ordering};
 use std::sync::{Mutex, LazyLock};
 
 // Global storage for comparison data
 static COMPARISON_DATA_STORE: LazyLock<Mutex<HashMap<String, String>>> = LazyLock::new(|| Mutex::new(HashMap::new()));
 
+// Global storage for response bodies, keyed by file number (1 or 2) and request index.
+// Bodies are kept out of the requests sent to the frontend, which are passed back
+// on every alignment, and only attached when a detailed comparison needs them.
+static RESPONSE_BODY_STORE: LazyLock<Mutex<HashMap<u8, StoredResponseBodies>>> = LazyLock::new(|| Mutex::new(HashMap::new()));
+
+// Id handed out to each loaded HAR file, see HarFile::load_id
+static NEXT_LOAD_ID: AtomicU64 = AtomicU64::new(1);
+
+struct StoredResponseBodies {
+    load_id: u64,
+    bodies: HashMap<usize, String>,
+}
+
 // Global storage for whitelist config
 static WHITELIST_CONFIG: LazyLock<Mutex<WhitelistConfig>> = LazyLock::new(|| Mutex::new(WhitelistConfig::new()));
 
 #[tauri::command]
-async fn open_har_file(app: tauri::AppHandle) -> Result<Option<HarFile>, String> {
+async fn open_har_file(app: tauri::AppHandle, file_number: u8) -> Result<Option<HarFile>, String> {
     use tauri_plugin_dialog::DialogExt;
 
     let file_path = app
@@ -24,18 +38,36 @@ async fn open_har_file(app: tauri::AppHandle) -> Result<Option<HarFile>, String>
     match file_path {
         Some(path) => {
             let path_str = path.to_string();
-            match fs::read_to_string(&path_str) {
-                Ok(content) => {
-                    match parse_har_file(&content) {
-                        Ok(requests) => Ok(Some(HarFile {
-                            requests,
-                            file_path: path_str,
-                        })),
-                        Err(e) => Err(format!("Failed to parse HAR file: {}", e)),
+            // Reading and parsing large HAR files is blocking work, keep it off the async runtime
+            tauri::async_runtime::spawn_blocking(move || {
+                match fs::read(&path_str) {
+                    Ok(content) => {
+                        match parse_har_file(&content) {
+                            Ok(mut requests) => {
+                                let response_bodies: HashMap<usize, String> = requests.iter_mut()
+                                    .filter_map(|r| r.response_body.take().map(|body| (r.index, body)))
+                                    .collect();
+                                let load_id = NEXT_LOAD_ID.fetch_add(1, Ordering::Relaxed);
+                                match RESPONSE_BODY_STORE.lock() {
+                                    Ok(mut store) => {
+                                        store.insert(file_number, StoredResponseBodies { load_id, bodies: response_bodies });
+                                    }
+                                    Err(e) => return Err(format!("Failed to store response bodies: {}", e)),
+                                }
+                                Ok(Some(HarFile {
+                                    requests,
+                                    file_path: path_str,
+                                    load_id,
+                                }))
+                            }
+                            Err(e) => Err(format!("Failed to parse HAR file: {}", e)),
+                        }
                     }
+                    Err(e) => Err(format!("Failed to read file: {}", e)),
                 }
-                Err(e) => Err(format!("Failed to read file: {}", e)),
-            }
+            })
+            .await
+            .map_err(|e| format!("Failed to load HAR file: {}", e))?
         }
         None => Ok(None), // User cancelled
     }
@@ -95,26 +127,67 @@ fn compare_har_requests(req1: HarRequest, req2: HarRequest, keys_only: bool) ->
     }
 }
 
+// Aligning and comparing run as async commands so they stay off the main thread
+// (synchronous commands run on it and freeze the window), with the work itself on
+// the blocking pool like file loading.
 #[tauri::command]
-fn align_har_requests(requests1: Vec<HarRequest>, requests2: Vec<HarRequest>) -> Vec<AlignedPair> {
-    let whitelist = WHITELIST_CONFIG.lock().ok();
-    align_requests_with_whitelist(&requests1, &requests2, whitelist.as_deref())
+async fn align_har_requests(requests1: Vec<HarRequest>, requests2: Vec<HarRequest>) -> Result<Vec<AlignedPair>, String> {
+    tauri::async_runtime::spawn_blocking(move || {
+        let whitelist = WHITELIST_CONFIG.lock().ok();
+        align_requests_with_whitelist(&requests1, &requests2, whitelist.as_deref())
+    })
+    .await
+    .map_err(|e| format!("Failed to align requests: {}", e))
 }
 
 #[tauri::command]
-fn align_har_requests_vscode(requests1: Vec<HarRequest>, requests2: Vec<HarRequest>) -> Vec<AlignedPair> {
-    let whitelist = WHITELIST_CONFIG.lock().ok();
-    align_requests_like_vscode_with_whitelist(&requests1, &requests2, whitelist.as_deref())
+async fn align_har_requests_vscode(requests1: Vec<HarRequest>, requests2: Vec<HarRequest>) -> Result<Vec<AlignedPair>, String> {
+    tauri::async_runtime::spawn_blocking(move || {
+        let whitelist = WHITELIST_CONFIG.lock().ok();
+        align_requests_like_vscode_with_whitelist(&requests1, &requests2, whitelist.as_deref())
+    })
+    .await
+    .map_err(|e| format!("Failed to align requests: {}", e))
 }
 
-#[tauri::command]
-fn get_detailed_comparison(req1: HarRequest, req2: HarRequest, keys_only: bool) -> DetailedComparison {
-    match WHITELIST_CONFIG.lock() {
-        Ok(whitelist) => create_detailed_comparison_with_whitelist(&req1, &req2, keys_only, &whitelist),
-        Err(_) => create_detailed_comparison_with_whitelist(&req1, &req2, keys_only, &WhitelistConfig::new())
+// Attach the stored response body to a request that was sent without one. The
+// request must come from the load currently stored for its file; after a reload the
+// same index holds another request's body.
+fn attach_response_body(req: &mut HarRequest, file_number: u8, load_id: u64) -> Result<(), String> {
+    let store = RESPONSE_BODY_STORE.lock()
+        .map_err(|e| format!("Failed to read response bodies: {}", e))?;
+    match store.get(&file_number) {
+        Some(stored) if stored.load_id == load_id => {
+            if req.response_body.is_none() {
+                req.response_body = stored.bodies.get(&req.index).cloned();
+            }
+            Ok(())
+        }
+        _ => Err(format!("HAR file {} has been reloaded, select the request again", file_number)),
     }
 }
 
+#[tauri::command]
+async fn get_detailed_comparison(
+    mut req1: HarRequest,
+    mut req2: HarRequest,
+    load_id1: u64,
+    load_id2: u64,
+    keys_only: bool,
+) -> Result<DetailedComparison, String> {
+    tauri::async_runtime::spawn_blocking(move || {
+        attach_response_body(&mut req1, 1, load_id1)?;
+        attach_response_body(&mut req2, 2, load_id2)?;
+
+        Ok(match WHITELIST_CONFIG.lock() {
+            Ok(whitelist) => create_detailed_comparison_with_whitelist(&req1, &req2, keys_only, &whitelist),
+            Err(_) => create_detailed_comparison_with_whitelist(&req1, &req2, keys_only, &WhitelistConfig::new())
+        })
+    })
+    .await
+    .map_err(|e| format!("Failed to get detailed comparison: {}", e))?
+}
+
 #[tauri::command]
 fn store_comparison_data(data_id: String, data: String) -> Result<(), String> {
     match COMPARISON_DATA_STORE.lock() {
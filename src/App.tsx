@@ -1,4 +1,4 @@
-import { useState, useRef, useCallback, useEffect } from "react";
+import { useState, useRef, useCallback, useEffect, useMemo, memo } from "react";
 import { invoke } from "@tauri-apps/api/core";
 import "./App.css";
 
@@ -18,6 +18,7 @@ interface HarRequest {
 interface HarFile {
   requests: HarRequest[];
   file_path: string;
+  load_id: number;
 }
 
 interface ComparisonResult {
@@ -54,6 +55,77 @@ interface DiffLine {
   content: string;
 }
 
+const getComparisonColor = (comparison?: ComparisonResult) => {
+  if (!comparison) return "var(--color-different)";
+  switch (comparison.status) {
+    case "match": return "var(--color-match)";
+    case "partial": return "var(--color-partial)";
+    case "whitelisted": return "var(--color-whitelisted)";
+    default: return "var(--color-different)";
+  }
+};
+
+interface PanelRow {
+  request: HarRequest | null;
+  color?: string;
+}
+
+// Resolve the rows a panel displays: aligned pairs (with empty placeholders) when an
+// alignment exists, otherwise the file's requests in order; null when there is nothing to show
+const buildPanelRows = (
+  harFile: HarFile | null,
+  alignedPairs: AlignedPair[],
+  pairColors: string[],
+  side: "index1" | "index2"
+): PanelRow[] | null => {
+  if (alignedPairs.length > 0) {
+    return alignedPairs.map((pair, index) => {
+      const requestIndex = pair[side];
+      const request = requestIndex !== undefined ? harFile?.requests[requestIndex] : null;
+      return { request: request || null, color: pairColors[index] };
+    });
+  }
+  return harFile ? harFile.requests.map(request => ({ request })) : null;
+};
+
+interface ListPosition {
+  request: HarRequest;
+  htmlListIndex: number;
+}
+
+// Map each request's display index to the request and its position in the rendered list
+const buildListPositions = (
+  harFile: HarFile | null,
+  alignedPairs: AlignedPair[],
+  side: "index1" | "index2"
+): Map<number, ListPosition> => {
+  const positions = new Map<number, ListPosition>();
+  if (!harFile) return positions;
+
+  if (alignedPairs.length > 0) {
+    // When using aligned pairs, positions are in the aligned pairs array
+    alignedPairs.forEach((pair, htmlListIndex) => {
+      const requestIndex = pair[side];
+      const request = requestIndex !== undefined ? harFile.requests[requestIndex] : undefined;
+      if (request && !positions.has(request.index)) {
+        positions.set(request.index, { request, htmlListIndex });
+      }
+    });
+  } else {
+    // When not using aligned pairs, positions are in the original requests array
+    harFile.requests.forEach((request, htmlListIndex) => {
+      if (!positions.has(request.index)) {
+        positions.set(request.index, { request, htmlListIndex });
+      }
+    });
+  }
+
+  return positions;
+};
+
+// Each cached comparison carries the full bodies of both requests, so only a few are kept
+const DETAILED_COMPARISON_CACHE_LIMIT = 3;
+
 function App() {
   const [harFile1, setHarFile1] = useState<HarFile | null>(null);
   const [harFile2, setHarFile2] = useState<HarFile | null>(null);
@@ -64,13 +136,29 @@ function App() {
   const [autoSelect, setAutoSelect] = useState(false);
   const [selectedRequest1, setSelectedRequest1] = useState<HarRequest | null>(null);
   const [selectedRequest2, setSelectedRequest2] = useState<HarRequest | null>(null);
-  const [loading, setLoading] = useState(false);
+  // Tracked per file so both HAR files can be parsed at the same time
+  const [loading1, setLoading1] = useState(false);
+  const [loading2, setLoading2] = useState(false);
   const [indexInput1, setIndexInput1] = useState<string>('');
   const [indexInput2, setIndexInput2] = useState<string>('');
   const [showDetailedComparison, setShowDetailedComparison] = useState(false);
   const [detailedComparisonData, setDetailedComparisonData] = useState<DetailedComparison | null>(null);
   const [whitelistLoaded, setWhitelistLoaded] = useState(false);
 
+  // Detailed comparisons already fetched or in flight, keyed by file loads and request indices. Keys-only
+  // mode is not part of the key: the backend builds the same sections either way.
+  const detailedComparisonCacheRef = useRef(new Map<string, Promise<DetailedComparison>>());
+
+  // Cached comparisons refer to the previous files' requests
+  useEffect(() => {
+    detailedComparisonCacheRef.current.clear();
+  }, [harFile1, harFile2]);
+
+  // Alignment and detailed comparison run concurrently on the backend and can resolve
+  // out of order; only the latest request of each kind is applied
+  const compareRequestIdRef = useRef(0);
+  const detailedRequestIdRef = useRef(0);
+
   // Refs for synchronized scrolling
   const leftPanelRef = useRef<HTMLDivElement>(null);
   const rightPanelRef = useRef<HTMLDivElement>(null);
@@ -201,6 +289,16 @@ function App() {
     }
   }, [autoSelect, findCorrespondingRequest1ByListPosition]);
 
+  // Lookup tables for "Go to index", rebuilt only when the displayed lists change
+  const listPositions1 = useMemo(
+    () => buildListPositions(harFile1, alignedPairs, "index1"),
+    [harFile1, alignedPairs]
+  );
+  const listPositions2 = useMemo(
+    () => buildListPositions(harFile2, alignedPairs, "index2"),
+    [harFile2, alignedPairs]
+  );
+
   // Index input handlers with auto-scroll
   const handleIndexInput1 = useCallback((value: string) => {
     setIndexInput1(value);
@@ -214,39 +312,25 @@ function App() {
       return;
     }
 
-    // Find request by index
-    const request = harFile1.requests.find(req => req.index === index);
-    if (request) {
-      // Find the HTML list position based on current display mode
-      let htmlListIndex = -1;
-
-      if (alignedPairs.length > 0) {
-        // When using aligned pairs, find the position in the aligned pairs array
-        htmlListIndex = alignedPairs.findIndex(pair =>
-          pair.index1 !== undefined && harFile1.requests[pair.index1]?.index === index
-        );
-      } else {
-        // When not using aligned pairs, find position in the original requests array
-        htmlListIndex = harFile1.requests.findIndex(req => req.index === index);
-      }
+    // Find request and its HTML list position by index
+    const position = listPositions1.get(index);
+    if (position) {
+      const { request, htmlListIndex } = position;
+      handleSelectRequest1(request, htmlListIndex);
 
-      if (htmlListIndex >= 0) {
-        handleSelectRequest1(request, htmlListIndex);
-
-        // Scroll to the selected item
-        setTimeout(() => {
-          const leftPanel = leftPanelRef.current;
-          if (leftPanel) {
-            const requestItems = leftPanel.querySelectorAll('.request-item');
-            const targetItem = requestItems[htmlListIndex];
-            if (targetItem) {
-              targetItem.scrollIntoView({ behavior: 'smooth', block: 'center' });
-            }
+      // Scroll to the selected item
+      setTimeout(() => {
+        const leftPanel = leftPanelRef.current;
+        if (leftPanel) {
+          const requestItems = leftPanel.querySelectorAll('.request-item');
+          const targetItem = requestItems[htmlListIndex];
+          if (targetItem) {
+            targetItem.scrollIntoView({ behavior: 'smooth', block: 'center' });
           }
-        }, 100);
-      }
+        }
+      }, 100);
     }
-  }, [harFile1, handleSelectRequest1, alignedPairs]);
+  }, [harFile1, handleSelectRequest1, listPositions1]);
 
   const handleIndexInput2 = useCallback((value: string) => {
     setIndexInput2(value);
@@ -260,49 +344,41 @@ function App() {
       return;
     }
 
-    // Find request by index
-    const request = harFile2.requests.find(req => req.index === index);
-    if (request) {
-      // Find the HTML list position based on current display mode
-      let htmlListIndex = -1;
-
-      if (alignedPairs.length > 0) {
-        // When using aligned pairs, find the position in the aligned pairs array
-        htmlListIndex = alignedPairs.findIndex(pair =>
-          pair.index2 !== undefined && harFile2.requests[pair.index2]?.index === index
-        );
-      } else {
-        // When not using aligned pairs, find position in the original requests array
-        htmlListIndex = harFile2.requests.findIndex(req => req.index === index);
-      }
+    // Find request and its HTML list position by index
+    const position = listPositions2.get(index);
+    if (position) {
+      const { request, htmlListIndex } = position;
+      handleSelectRequest2(request, htmlListIndex);
 
-      if (htmlListIndex >= 0) {
-        handleSelectRequest2(request, htmlListIndex);
-
-        // Scroll to the selected item
-        setTimeout(() => {
-          const rightPanel = rightPanelRef.current;
-          if (rightPanel) {
-            const requestItems = rightPanel.querySelectorAll('.request-item');
-            const targetItem = requestItems[htmlListIndex];
-            if (targetItem) {
-              targetItem.scrollIntoView({ behavior: 'smooth', block: 'center' });
-            }
+      // Scroll to the selected item
+      setTimeout(() => {
+        const rightPanel = rightPanelRef.current;
+        if (rightPanel) {
+          const requestItems = rightPanel.querySelectorAll('.request-item');
+          const targetItem = requestItems[htmlListIndex];
+          if (targetItem) {
+            targetItem.scrollIntoView({ behavior: 'smooth', block: 'center' });
           }
-        }, 100);
-      }
+        }
+      }, 100);
     }
-  }, [harFile2, handleSelectRequest2, alignedPairs]);
+  }, [harFile2, handleSelectRequest2, listPositions2]);
 
   const openHarFile = async (fileNumber: 1 | 2) => {
+    const setLoading = fileNumber === 1 ? setLoading1 : setLoading2;
     setLoading(true);
     try {
-      const result = await invoke<HarFile | null>("open_har_file");
+      const result = await invoke<HarFile | null>("open_har_file", { fileNumber });
       if (result) {
+        // A selection from the replaced file no longer belongs to any loaded request
         if (fileNumber === 1) {
           setHarFile1(result);
+          setSelectedRequest1(null);
+          setIndexInput1('');
         } else {
           setHarFile2(result);
+          setSelectedRequest2(null);
+          setIndexInput2('');
         }
       }
     } catch (error) {
@@ -317,6 +393,7 @@ function App() {
     try {
       const result = await invoke<boolean>("load_whitelist_config");
       if (result) {
+        detailedComparisonCacheRef.current.clear();
         setWhitelistLoaded(true);
         // Trigger re-comparison if both files are loaded
         if (harFile1 && harFile2 && alignedPairs.length > 0) {
@@ -333,6 +410,7 @@ function App() {
   const clearWhitelistConfig = async () => {
     try {
       await invoke("clear_whitelist_config");
+      detailedComparisonCacheRef.current.clear();
       setWhitelistLoaded(false);
       // Trigger re-comparison if both files are loaded
       if (harFile1 && harFile2 && alignedPairs.length > 0) {
@@ -348,30 +426,69 @@ function App() {
   const compareFiles = async () => {
     if (!harFile1 || !harFile2) return;
 
+    const requestId = ++compareRequestIdRef.current;
     try {
       const commandName = alignRequests ? "align_har_requests_vscode" : "align_har_requests";
       const aligned = await invoke<AlignedPair[]>(commandName, {
         requests1: harFile1.requests,
         requests2: harFile2.requests,
       });
+      // A newer comparison was started while this one ran
+      if (requestId !== compareRequestIdRef.current) return;
       setAlignedPairs(aligned);
     } catch (error) {
       console.error("Failed to compare files:", error);
     }
   };
 
+  const fetchDetailedComparison = useCallback((
+    req1: HarRequest,
+    req2: HarRequest,
+    loadId1: number,
+    loadId2: number,
+    keysOnly: boolean
+  ): Promise<DetailedComparison> => {
+    const cache = detailedComparisonCacheRef.current;
+    const cacheKey = `${loadId1}:${req1.index}:${loadId2}:${req2.index}`;
+    let detailed = cache.get(cacheKey);
+    if (detailed) {
+      // Re-insert so the map's order stays least recently used first
+      cache.delete(cacheKey);
+      cache.set(cacheKey, detailed);
+    } else {
+      // The load ids let the backend refuse requests from a file that has since been reopened
+      const request = invoke<DetailedComparison>("get_detailed_comparison", { req1, req2, loadId1, loadId2, keysOnly });
+      // Failed comparisons are dropped so opening the comparison again retries them
+      request.catch(() => {
+        if (cache.get(cacheKey) === request) cache.delete(cacheKey);
+      });
+      // Evict the least recently used comparison
+      if (cache.size >= DETAILED_COMPARISON_CACHE_LIMIT) {
+        cache.delete(cache.keys().next().value!);
+      }
+      cache.set(cacheKey, request);
+      detailed = request;
+    }
+    return detailed;
+  }, []);
+
   const openDetailedComparison = async () => {
-    if (!selectedRequest1 || !selectedRequest2) {
+    if (!selectedRequest1 || !selectedRequest2 || !harFile1 || !harFile2) {
       alert("Please select requests from both files first");
       return;
     }
 
+    const requestId = ++detailedRequestIdRef.current;
     try {
-      const detailed = await invoke<DetailedComparison>("get_detailed_comparison", {
-        req1: selectedRequest1,
-        req2: selectedRequest2,
-        keysOnly,
-      });
+      const detailed = await fetchDetailedComparison(
+        selectedRequest1,
+        selectedRequest2,
+        harFile1.load_id,
+        harFile2.load_id,
+        keysOnly
+      );
+      // Another comparison was opened while this one was being built
+      if (requestId !== detailedRequestIdRef.current) return;
 
       setDetailedComparisonData(detailed);
       setShowDetailedComparison(true);
@@ -381,15 +498,30 @@ function App() {
     }
   };
 
-  const getComparisonColor = (comparison?: ComparisonResult) => {
-    if (!comparison) return "var(--color-different)";
-    switch (comparison.status) {
-      case "match": return "var(--color-match)";
-      case "partial": return "var(--color-partial)";
-      case "whitelisted": return "var(--color-whitelisted)";
-      default: return "var(--color-different)";
-    }
-  };
+  // Rows are memoized, so they reach the latest openDetailedComparison through a ref
+  const openDetailedComparisonRef = useRef(openDetailedComparison);
+  useEffect(() => {
+    openDetailedComparisonRef.current = openDetailedComparison;
+  });
+  const handleOpenDetailedComparison = useCallback(() => {
+    openDetailedComparisonRef.current();
+  }, []);
+
+  // Both panels color their rows by the same pair, so compute the colors once per alignment
+  const pairColors = useMemo(
+    () => alignedPairs.map(pair => getComparisonColor(pair.comparison)),
+    [alignedPairs]
+  );
+
+  // Panel rows are resolved once per file/alignment change instead of on every render
+  const rows1 = useMemo(
+    () => buildPanelRows(harFile1, alignedPairs, pairColors, "index1"),
+    [harFile1, alignedPairs, pairColors]
+  );
+  const rows2 = useMemo(
+    () => buildPanelRows(harFile2, alignedPairs, pairColors, "index2"),
+    [harFile2, alignedPairs, pairColors]
+  );
 
   // Zoom functionality via keyboard shortcuts
   useEffect(() => {
@@ -523,9 +655,9 @@ function App() {
                 <button
                   onClick={() => openHarFile(1)}
                   className="open-file-btn"
-                  disabled={loading}
+                  disabled={loading1}
                 >
-                  {loading ? "Loading..." : "Open HAR File"}
+                  {loading1 ? "Loading..." : "Open HAR File"}
                 </button>
               </div>
             </div>
@@ -540,43 +672,18 @@ function App() {
               ref={leftPanelRef}
               onScroll={handleLeftScroll}
             >
-              {alignedPairs.length > 0 ? (
-                alignedPairs.map((pair, index) => {
-                  const request = pair.index1 !== undefined ? harFile1?.requests[pair.index1] : null;
-                  return (
-                    <div
-                      key={index}
-                      className={`request-item ${selectedRequest1 === (request || null) ? 'selected' : ''}`}
-                      style={{ backgroundColor: getComparisonColor(pair.comparison) }}
-                      onClick={() => handleSelectRequest1(request || null, index)}
-                      onDoubleClick={() => request && selectedRequest2 && openDetailedComparison()}
-                    >
-                      {request ? (
-                        <>
-                          <span className="index">{request.index}</span>
-                          <span className="method">{request.method}</span>
-                          <span className="path">{request.url}</span>
-                          <span className="status">{request.response_status}</span>
-                        </>
-                      ) : (
-                        <span className="empty">-</span>
-                      )}
-                    </div>
-                  );
-                })
-              ) : harFile1 ? (
-                harFile1.requests.map((request, index) => (
-                  <div
+              {rows1 ? (
+                rows1.map((row, index) => (
+                  <RequestRow
                     key={index}
-                    className={`request-item ${selectedRequest1 === request ? 'selected' : ''}`}
-                    onClick={() => handleSelectRequest1(request, index)}
-                    onDoubleClick={() => selectedRequest2 && openDetailedComparison()}
-                  >
-                    <span className="index">{request.index}</span>
-                    <span className="method">{request.method}</span>
-                    <span className="path">{request.url}</span>
-                    <span className="status">{request.response_status}</span>
-                  </div>
+                    request={row.request}
+                    htmlListIndex={index}
+                    selected={selectedRequest1 === row.request}
+                    backgroundColor={row.color}
+                    canOpenComparison={selectedRequest2 !== null}
+                    onSelect={handleSelectRequest1}
+                    onOpenComparison={handleOpenDetailedComparison}
+                  />
                 ))
               ) : (
                 <div className="empty-state">No HAR file loaded</div>
@@ -604,9 +711,9 @@ function App() {
                 <button
                   onClick={() => openHarFile(2)}
                   className="open-file-btn"
-                  disabled={loading}
+                  disabled={loading2}
                 >
-                  {loading ? "Loading..." : "Open HAR File"}
+                  {loading2 ? "Loading..." : "Open HAR File"}
                 </button>
               </div>
             </div>
@@ -621,43 +728,18 @@ function App() {
               ref={rightPanelRef}
               onScroll={handleRightScroll}
             >
-              {alignedPairs.length > 0 ? (
-                alignedPairs.map((pair, index) => {
-                  const request = pair.index2 !== undefined ? harFile2?.requests[pair.index2] : null;
-                  return (
-                    <div
-                      key={index}
-                      className={`request-item ${selectedRequest2 === (request || null) ? 'selected' : ''}`}
-                      style={{ backgroundColor: getComparisonColor(pair.comparison) }}
-                      onClick={() => handleSelectRequest2(request || null, index)}
-                      onDoubleClick={() => request && selectedRequest1 && openDetailedComparison()}
-                    >
-                      {request ? (
-                        <>
-                          <span className="index">{request.index}</span>
-                          <span className="method">{request.method}</span>
-                          <span className="path">{request.url}</span>
-                          <span className="status">{request.response_status}</span>
-                        </>
-                      ) : (
-                        <span className="empty">-</span>
-                      )}
-                    </div>
-                  );
-                })
-              ) : harFile2 ? (
-                harFile2.requests.map((request, index) => (
-                  <div
+              {rows2 ? (
+                rows2.map((row, index) => (
+                  <RequestRow
                     key={index}
-                    className={`request-item ${selectedRequest2 === request ? 'selected' : ''}`}
-                    onClick={() => handleSelectRequest2(request, index)}
-                    onDoubleClick={() => selectedRequest1 && openDetailedComparison()}
-                  >
-                    <span className="index">{request.index}</span>
-                    <span className="method">{request.method}</span>
-                    <span className="path">{request.url}</span>
-                    <span className="status">{request.response_status}</span>
-                  </div>
+                    request={row.request}
+                    htmlListIndex={index}
+                    selected={selectedRequest2 === row.request}
+                    backgroundColor={row.color}
+                    canOpenComparison={selectedRequest1 !== null}
+                    onSelect={handleSelectRequest2}
+                    onOpenComparison={handleOpenDetailedComparison}
+                  />
                 ))
               ) : (
                 <div className="empty-state">No HAR file loaded</div>
@@ -701,6 +783,47 @@ function App() {
   );
 }
 
+// Request list row, memoized so a selection change only re-renders the rows it affects
+interface RequestRowProps {
+  request: HarRequest | null;
+  htmlListIndex: number;
+  selected: boolean;
+  backgroundColor?: string;
+  canOpenComparison: boolean;
+  onSelect: (request: HarRequest | null, htmlListIndex: number) => void;
+  onOpenComparison: () => void;
+}
+
+const RequestRow = memo(function RequestRow({
+  request,
+  htmlListIndex,
+  selected,
+  backgroundColor,
+  canOpenComparison,
+  onSelect,
+  onOpenComparison,
+}: RequestRowProps) {
+  return (
+    <div
+      className={`request-item ${selected ? 'selected' : ''}`}
+      style={backgroundColor ? { backgroundColor } : undefined}
+      onClick={() => onSelect(request, htmlListIndex)}
+      onDoubleClick={() => request && canOpenComparison && onOpenComparison()}
+    >
+      {request ? (
+        <>
+          <span className="index">{request.index}</span>
+          <span className="method">{request.method}</span>
+          <span className="path">{request.url}</span>
+          <span className="status">{request.response_status}</span>
+        </>
+      ) : (
+        <span className="empty">-</span>
+      )}
+    </div>
+  );
+});
+
 // Detailed Comparison Modal Component
 interface DetailedComparisonModalProps {
   detailed: DetailedComparison;
@@ -709,8 +832,34 @@ interface DetailedComparisonModalProps {
   onClose: () => void;
 }
 
+interface ComparisonTab {
+  id: string;
+  label: string;
+  section?: ComparisonSection;
+  title1: string;
+  title2: string;
+}
+
 function DetailedComparisonModal({ detailed, req1, req2, onClose }: DetailedComparisonModalProps) {
   const [activeTab, setActiveTab] = useState("general");
+  // Tabs are built the first time they are opened and then kept mounted (hidden),
+  // so switching back does not rebuild the diff view
+  const [visitedTabs, setVisitedTabs] = useState<Set<string>>(() => new Set(["general"]));
+
+  const selectTab = (tabId: string) => {
+    setActiveTab(tabId);
+    setVisitedTabs(prev => (prev.has(tabId) ? prev : new Set(prev).add(tabId)));
+  };
+
+  const tabs: ComparisonTab[] = [
+    { id: 'general', label: 'General', section: detailed.general, title1: "File 1", title2: "File 2" },
+    { id: 'raw_request', label: 'Raw Request', section: detailed.raw_request, title1: "File 1 Raw Request", title2: "File 2 Raw Request" },
+    { id: 'headers', label: 'Headers', section: detailed.headers, title1: "File 1 Headers", title2: "File 2 Headers" },
+    { id: 'payloads', label: 'Payloads', section: detailed.payloads, title1: "File 1 Payload", title2: "File 2 Payload" },
+    { id: 'params', label: 'Parameters', section: detailed.params, title1: "File 1 Parameters", title2: "File 2 Parameters" },
+    { id: 'response', label: 'Response', section: detailed.response, title1: "File 1 Response", title2: "File 2 Response" },
+    { id: 'response_body', label: 'Response Body', section: detailed.response_body, title1: "File 1 Response Body", title2: "File 2 Response Body" },
+  ];
 
   return (
     <div className="modal-overlay" onClick={onClose}>
@@ -724,82 +873,27 @@ function DetailedComparisonModal({ detailed, req1, req2, onClose }: DetailedComp
         </div>
 
         <div className="modal-tabs">
-          <button
-            className={`modal-tab ${activeTab === 'general' ? 'active' : ''}`}
-            onClick={() => setActiveTab('general')}
-          >
-            General
-          </button>
-          <button
-            className={`modal-tab ${activeTab === 'raw_request' ? 'active' : ''}`}
-            onClick={() => setActiveTab('raw_request')}
-          >
-            Raw Request
-          </button>
-          <button
-            className={`modal-tab ${activeTab === 'headers' ? 'active' : ''}`}
-            onClick={() => setActiveTab('headers')}
-          >
-            Headers
-          </button>
-          {detailed.payloads && (
-            <button
-              className={`modal-tab ${activeTab === 'payloads' ? 'active' : ''}`}
-              onClick={() => setActiveTab('payloads')}
-            >
-              Payloads
-            </button>
-          )}
-          <button
-            className={`modal-tab ${activeTab === 'params' ? 'active' : ''}`}
-            onClick={() => setActiveTab('params')}
-          >
-            Parameters
-          </button>
-          <button
-            className={`modal-tab ${activeTab === 'response' ? 'active' : ''}`}
-            onClick={() => setActiveTab('response')}
-          >
-            Response
-          </button>
-          {detailed.response_body && (
+          {tabs.map(tab => tab.section && (
             <button
-              className={`modal-tab ${activeTab === 'response_body' ? 'active' : ''}`}
-              onClick={() => setActiveTab('response_body')}
+              key={tab.id}
+              className={`modal-tab ${activeTab === tab.id ? 'active' : ''}`}
+              onClick={() => selectTab(tab.id)}
             >
-              Response Body
+              {tab.label}
             </button>
-          )}
+          ))}
         </div>
 
         <div className="modal-body">
-          {activeTab === 'general' && (
-            <DiffView section={detailed.general} title1="File 1" title2="File 2" />
-          )}
-
-          {activeTab === 'raw_request' && (
-            <DiffView section={detailed.raw_request} title1="File 1 Raw Request" title2="File 2 Raw Request" />
-          )}
-
-          {activeTab === 'headers' && (
-            <DiffView section={detailed.headers} title1="File 1 Headers" title2="File 2 Headers" />
-          )}
-
-          {activeTab === 'payloads' && detailed.payloads && (
-            <DiffView section={detailed.payloads} title1="File 1 Payload" title2="File 2 Payload" />
-          )}
-
-          {activeTab === 'params' && (
-            <DiffView section={detailed.params} title1="File 1 Parameters" title2="File 2 Parameters" />
-          )}
-
-          {activeTab === 'response' && (
-            <DiffView section={detailed.response} title1="File 1 Response" title2="File 2 Response" />
-          )}
-
-          {activeTab === 'response_body' && detailed.response_body && (
-            <DiffView section={detailed.response_body} title1="File 1 Response Body" title2="File 2 Response Body" />
-          )}
+          {tabs.map(tab => tab.section && visitedTabs.has(tab.id) && (
+            <DiffView
+              key={tab.id}
+              section={tab.section}
+              title1={tab.title1}
+              title2={tab.title2}
+              hidden={activeTab !== tab.id}
+            />
+          ))}
         </div>
       </div>
     </div>
@@ -811,15 +905,103 @@ interface DiffViewProps {
   section: ComparisonSection;
   title1: string;
   title2: string;
+  hidden?: boolean;
 }
 
+type DiffLineType = 'same' | 'added' | 'removed' | 'whitelisted';
+
 interface DiffLineData {
   lineNum: number;
   content: string;
-  type: 'same' | 'added' | 'removed' | 'whitelisted';
+  type: DiffLineType;
+  className: string;
 }
 
-function DiffView({ section, title1, title2 }: DiffViewProps) {
+const getLineClass = (type: DiffLineType): string => {
+  switch (type) {
+    case 'added': return 'diff-line diff-line-added';
+    case 'removed': return 'diff-line diff-line-removed';
+    case 'whitelisted': return 'diff-line diff-line-whitelisted';
+    default: return 'diff-line diff-line-same';
+  }
+};
+
+// The class is resolved once while diffing instead of on every render of every line
+const diffLine = (lineNum: number, content: string, type: DiffLineType): DiffLineData =>
+  ({ lineNum, content, type, className: getLineClass(type) });
+
+// Simple line-by-line diff algorithm
+const computeDiff = (section: ComparisonSection): { left: DiffLineData[]; right: DiffLineData[] } => {
+  // Identical content (e.g. unchanged bodies) needs no per-line comparison; both panes share the lines
+  if (section.content1 === section.content2) {
+    const same = section.content1.split('\n').map((line, i) => diffLine(i + 1, line, 'same'));
+    return { left: same, right: same };
+  }
+
+  const lines1 = section.content1.split('\n');
+  const lines2 = section.content2.split('\n');
+  const left: DiffLineData[] = [];
+  const right: DiffLineData[] = [];
+  const whitelistPattern = buildWhitelistPattern(section.whitelisted_keys);
+
+  const maxLen = Math.max(lines1.length, lines2.length);
+
+  for (let i = 0; i < maxLen; i++) {
+    const line1 = lines1[i] !== undefined ? lines1[i] : '';
+    const line2 = lines2[i] !== undefined ? lines2[i] : '';
+
+    if (line1 === line2) {
+      // Lines are identical, both panes share one line
+      const line = diffLine(i + 1, line1, 'same');
+      left.push(line);
+      right.push(line);
+    } else {
+      // Lines are different - check if whitelisted
+      const isWhitelisted = isLineWhitelisted(line1, line2, whitelistPattern);
+
+      if (lines1[i] === undefined) {
+        // Line only in right side
+        left.push(diffLine(i + 1, '', 'same'));
+        right.push(diffLine(i + 1, line2, isWhitelisted ? 'whitelisted' : 'added'));
+      } else if (lines2[i] === undefined) {
+        // Line only in left side
+        left.push(diffLine(i + 1, line1, isWhitelisted ? 'whitelisted' : 'removed'));
+        right.push(diffLine(i + 1, '', 'same'));
+      } else {
+        // Both lines exist but are different
+        left.push(diffLine(i + 1, line1, isWhitelisted ? 'whitelisted' : 'removed'));
+        right.push(diffLine(i + 1, line2, isWhitelisted ? 'whitelisted' : 'added'));
+      }
+    }
+  }
+
+  return { left, right };
+};
+
+const escapeRegExp = (text: string): string => text.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+
+// One case-insensitive pattern for all whitelisted keys, built once per section. It matches
+// lines starting with the key (for "key: value" format) or containing it as a JSON property
+// (for "key": value format), without lowercased copies of every differing line.
+const buildWhitelistPattern = (whitelistedKeys: string[]): RegExp | null => {
+  if (whitelistedKeys.length === 0) return null;
+  const keys = whitelistedKeys.map(escapeRegExp).join('|');
+  return new RegExp(`^(?:${keys}):|"(?:${keys})"`, 'i');
+};
+
+const isLineWhitelisted = (line1: string, line2: string, pattern: RegExp | null): boolean =>
+  pattern !== null && (pattern.test(line1) || pattern.test(line2));
+
+const renderDiffLines = (lines: DiffLineData[]) =>
+  lines.map((line, index) => (
+    <div key={index} className={line.className}>
+      <span className="diff-line-number">{line.content ? line.lineNum : ''}</span>
+      <pre className="diff-line-content">{line.content || ' '}</pre>
+    </div>
+  ));
+
+// Memoized so switching tabs only re-renders the two views whose visibility changes
+const DiffView = memo(function DiffView({ section, title1, title2, hidden }: DiffViewProps) {
   const [copiedButton, setCopiedButton] = useState<string | null>(null);
 
   // Refs for synchronized scrolling
@@ -875,80 +1057,14 @@ function DiffView({ section, title1, title2 }: DiffViewProps) {
     }
   }, []);
 
-  // Simple line-by-line diff algorithm
-  const computeDiff = (): { left: DiffLineData[]; right: DiffLineData[] } => {
-    const lines1 = section.content1.split('\n');
-    const lines2 = section.content2.split('\n');
-    const left: DiffLineData[] = [];
-    const right: DiffLineData[] = [];
-
-    const maxLen = Math.max(lines1.length, lines2.length);
-
-    for (let i = 0; i < maxLen; i++) {
-      const line1 = lines1[i] !== undefined ? lines1[i] : '';
-      const line2 = lines2[i] !== undefined ? lines2[i] : '';
-
-      if (line1 === line2) {
-        // Lines are identical
-        left.push({ lineNum: i + 1, content: line1, type: 'same' });
-        right.push({ lineNum: i + 1, content: line2, type: 'same' });
-      } else {
-        // Lines are different - check if whitelisted
-        const isWhitelisted = isLineWhitelisted(line1, line2, section.whitelisted_keys);
-
-        if (lines1[i] === undefined) {
-          // Line only in right side
-          left.push({ lineNum: i + 1, content: '', type: 'same' });
-          right.push({ lineNum: i + 1, content: line2, type: isWhitelisted ? 'whitelisted' : 'added' });
-        } else if (lines2[i] === undefined) {
-          // Line only in left side
-          left.push({ lineNum: i + 1, content: line1, type: isWhitelisted ? 'whitelisted' : 'removed' });
-          right.push({ lineNum: i + 1, content: '', type: 'same' });
-        } else {
-          // Both lines exist but are different
-          left.push({ lineNum: i + 1, content: line1, type: isWhitelisted ? 'whitelisted' : 'removed' });
-          right.push({ lineNum: i + 1, content: line2, type: isWhitelisted ? 'whitelisted' : 'added' });
-        }
-      }
-    }
-
-    return { left, right };
-  };
-
-  const isLineWhitelisted = (line1: string, line2: string, whitelistedKeys: string[]): boolean => {
-    if (whitelistedKeys.length === 0) return false;
-
-    // Check if the line contains any whitelisted key
-    const lineLower1 = line1.toLowerCase();
-    const lineLower2 = line2.toLowerCase();
-
-    for (const key of whitelistedKeys) {
-      // Check if the line starts with the key (for "key: value" format)
-      if (lineLower1.startsWith(key + ':') || lineLower2.startsWith(key + ':')) {
-        return true;
-      }
-      // Check if the line contains the key as a JSON property (for "key": value format)
-      if (lineLower1.includes(`"${key}"`) || lineLower2.includes(`"${key}"`)) {
-        return true;
-      }
-    }
-
-    return false;
-  };
-
-  const { left, right } = computeDiff();
-
-  const getLineClass = (type: string): string => {
-    switch (type) {
-      case 'added': return 'diff-line-added';
-      case 'removed': return 'diff-line-removed';
-      case 'whitelisted': return 'diff-line-whitelisted';
-      default: return 'diff-line-same';
-    }
-  };
+  // Only recompute the diff when the section changes, not on every re-render (e.g. copy feedback)
+  const { left, right } = useMemo(() => computeDiff(section), [section]);
+  // Same elements across re-renders, so React skips reconciling every line
+  const leftLines = useMemo(() => renderDiffLines(left), [left]);
+  const rightLines = useMemo(() => renderDiffLines(right), [right]);
 
   return (
-    <div className="custom-diff-container">
+    <div className="custom-diff-container" style={hidden ? { display: 'none' } : undefined}>
       {/* Custom title bar with copy buttons */}
       <div className="diff-title-bar">
         <div className="diff-title-section">
@@ -980,28 +1096,18 @@ function DiffView({ section, title1, title2 }: DiffViewProps) {
           ref={leftPaneRef}
           onScroll={handleLeftScroll}
         >
-          {left.map((line, index) => (
-            <div key={index} className={`diff-line ${getLineClass(line.type)}`}>
-              <span className="diff-line-number">{line.content ? line.lineNum : ''}</span>
-              <pre className="diff-line-content">{line.content || ' '}</pre>
-            </div>
-          ))}
+          {leftLines}
         </div>
         <div
           className="diff-pane"
           ref={rightPaneRef}
           onScroll={handleRightScroll}
         >
-          {right.map((line, index) => (
-            <div key={index} className={`diff-line ${getLineClass(line.type)}`}>
-              <span className="diff-line-number">{line.content ? line.lineNum : ''}</span>
-              <pre className="diff-line-content">{line.content || ' '}</pre>
-            </div>
-          ))}
+          {rightLines}
         </div>
       </div>
     </div>
   );
-}
+});
 
 export default App;